@@ -15,6 +15,48 @@ try:
 except ImportError:
     OLLAMA_AVAILABLE = False
 
+# Static prompt text is built once at import; only transcripts vary per request
+CLEAN_PROMPT = """Clean this podcast transcript by:
+1. Removing filler words (um, uh, like, you know)
+2. Fixing grammar and punctuation
+3. Preserving technical terms and proper nouns exactly
+4. Maintaining the speaker's voice and meaning
+5. Breaking into clear paragraphs
+
+Return only the cleaned text, no additional commentary.
+
+Transcript:
+"""
+
+SUMMARY_FORMAT = """{
+  "key_topics": ["topic1", "topic2", ...],
+  "themes": ["theme1", "theme2", ...],  
+  "quotes": ["notable quote 1", "notable quote 2", ...],
+  "startups": ["company1", "company2", ...],
+  "summary": "Brief 2-3 sentence summary"
+}
+
+Guidelines:
+- key_topics: Main subjects discussed (3-5 topics)
+- themes: Broader themes or patterns (2-4 themes)  
+- quotes: Memorable, insightful quotes (2-3 max)
+- startups: Any companies, startups, or brands mentioned
+- summary: Concise overview of the episode
+"""
+
+SUMMARY_PROMPT = (
+    "Analyze this podcast transcript and extract structured information in JSON format:\n\n"
+    + SUMMARY_FORMAT
+    + "\nTranscript:\n"
+)
+
+SUMMARY_BATCH_PROMPT = (
+    "Analyze each numbered podcast transcript below. Return a JSON array with one "
+    "object per transcript, in the same order, each in this format:\n\n"
+    + SUMMARY_FORMAT
+    + "\n"
+)
+
 
 class TranscriptCleaner:
     def __init__(self, db: P3Database, llm_provider: str = "openai", 
@@ -73,18 +115,6 @@ class TranscriptCleaner:
 
     def _openai_clean(self, text: str) -> str:
         """Clean transcript using OpenAI API."""
-        prompt = """Clean this podcast transcript by:
-1. Removing filler words (um, uh, like, you know)
-2. Fixing grammar and punctuation
-3. Preserving technical terms and proper nouns exactly
-4. Maintaining the speaker's voice and meaning
-5. Breaking into clear paragraphs
-
-Return only the cleaned text, no additional commentary.
-
-Transcript:
-"""
-        
         with httpx.Client(timeout=60.0) as client:
             response = client.post(
                 "https://api.openai.com/v1/chat/completions",
@@ -96,7 +126,7 @@ Transcript:
                     "model": self.llm_model,
                     "messages": [
                         {"role": "system", "content": "You are an expert transcript editor."},
-                        {"role": "user", "content": prompt + text}
+                        {"role": "user", "content": CLEAN_PROMPT + text}
                     ],
                     "temperature": 0.1,
                     "max_tokens": min(len(text) * 2, 4000)
@@ -120,17 +150,7 @@ Transcript:
             print("Ollama not available, skipping LLM cleaning")
             return text
             
-        prompt = """Clean this podcast transcript by:
-1. Removing filler words (um, uh, like, you know)
-2. Fixing grammar and punctuation
-3. Preserving technical terms and proper nouns exactly
-4. Maintaining the speaker's voice and meaning
-5. Breaking into clear paragraphs
-
-Return only the cleaned text, no additional commentary.
-
-Transcript:
-""" + text
+        prompt = CLEAN_PROMPT + text
 
         try:
             response = ollama.chat(
@@ -147,19 +167,64 @@ Transcript:
 
     def generate_summary(self, episode_id: int) -> Dict[str, Any]:
         """Generate structured summary of an episode."""
-        # Get transcript segments
-        segments = self.db.get_transcripts_for_episode(episode_id)
-        full_text = "\n".join(segment['text'] for segment in segments)
-        
-        if not full_text.strip():
+        cleaned_text = self._load_cleaned_transcript(episode_id)
+        if cleaned_text is None:
             return None
         
-        # Clean the transcript first
-        cleaned_text = self.clean_transcript(full_text)
-        
         # Generate structured summary using LLM
         summary_data = self._generate_structured_summary(cleaned_text)
+        self._store_summary(episode_id, summary_data)
+        return summary_data
+
+    def generate_summary_batch(self, episode_ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """Generate summaries for several episodes with a single LLM request.
         
+        Only OpenAI is batched; other providers fall back to one
+        generate_summary call per episode, and a failed batch falls back to
+        one summarization request per transcript.
+        """
+        if self.llm_provider != "openai" or not self.api_key or len(episode_ids) < 2:
+            return [self.generate_summary(episode_id) for episode_id in episode_ids]
+        
+        texts = {}
+        for episode_id in episode_ids:
+            cleaned_text = self._load_cleaned_transcript(episode_id)
+            if cleaned_text is not None:
+                texts[episode_id] = cleaned_text
+        
+        batch = None
+        if len(texts) > 1:
+            try:
+                batch = self._openai_extract_batch(list(texts.values()))
+            except Exception as e:
+                print(f"Batch summarization failed: {e}")
+        
+        if batch is not None:
+            summaries = dict(zip(texts, batch))
+        else:
+            summaries = {
+                episode_id: self._generate_structured_summary(text)
+                for episode_id, text in texts.items()
+            }
+        
+        results = []
+        for episode_id in episode_ids:
+            summary_data = summaries.get(episode_id)
+            self._store_summary(episode_id, summary_data)
+            results.append(summary_data)
+        return results
+
+    def _load_cleaned_transcript(self, episode_id: int) -> Optional[str]:
+        """Load an episode's transcript and clean it, or None if it is empty."""
+        full_text = self.db.get_transcript_text(episode_id)
+        
+        if not full_text.strip():
+            return None
+        
+        return self.clean_transcript(full_text)
+
+    def _store_summary(self, episode_id: int, summary_data: Optional[Dict[str, Any]]):
+        """Store a generated summary and mark the episode processed."""
         if summary_data:
             # Store in database
             self.db.add_summary(
@@ -174,8 +239,6 @@ Transcript:
             
             # Update episode status
             self.db.update_episode_status(episode_id, 'processed')
-        
-        return summary_data
 
     def _generate_structured_summary(self, text: str) -> Optional[Dict[str, Any]]:
         """Generate structured summary using LLM."""
@@ -183,39 +246,52 @@ Transcript:
             # Fallback to simple extraction
             return self._basic_extraction(text)
 
-        prompt = """Analyze this podcast transcript and extract structured information in JSON format:
-
-{
-  "key_topics": ["topic1", "topic2", ...],
-  "themes": ["theme1", "theme2", ...],  
-  "quotes": ["notable quote 1", "notable quote 2", ...],
-  "startups": ["company1", "company2", ...],
-  "summary": "Brief 2-3 sentence summary"
-}
-
-Guidelines:
-- key_topics: Main subjects discussed (3-5 topics)
-- themes: Broader themes or patterns (2-4 themes)  
-- quotes: Memorable, insightful quotes (2-3 max)
-- startups: Any companies, startups, or brands mentioned
-- summary: Concise overview of the episode
-
-Transcript:
-"""
+        prompt = SUMMARY_PROMPT + text
         
         try:
             if self.llm_provider == "openai":
-                return self._openai_extract(prompt + text)
+                return self._openai_extract(prompt)
             elif self.llm_provider == "anthropic":
-                return self._anthropic_extract(prompt + text)
+                return self._anthropic_extract(prompt)
             elif self.llm_provider == "ollama":
-                return self._ollama_extract(prompt + text)
+                return self._ollama_extract(prompt)
         except Exception as e:
             print(f"LLM summarization failed: {e}")
             return self._basic_extraction(text)
 
     def _openai_extract(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Extract using OpenAI API."""
+        content = self._openai_analyze(prompt, max_tokens=1000)
+        if content:
+            # Extract JSON from response (in case there's extra text)
+            json_start = content.find('{')
+            json_end = content.rfind('}') + 1
+            if json_start >= 0 and json_end > json_start:
+                json_str = content[json_start:json_end]
+                return json.loads(json_str)
+        
+        return None
+
+    def _openai_extract_batch(self, texts: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Extract summaries for several transcripts from one OpenAI request."""
+        prompt = SUMMARY_BATCH_PROMPT + "\n\n".join(
+            f"Transcript {i}:\n{text}" for i, text in enumerate(texts, 1)
+        )
+        content = self._openai_analyze(prompt, max_tokens=min(1000 * len(texts), 4000))
+        if content:
+            # Extract JSON array from response (in case there's extra text)
+            json_start = content.find('[')
+            json_end = content.rfind(']') + 1
+            if json_start >= 0 and json_end > json_start:
+                summaries = json.loads(content[json_start:json_end])
+                if (isinstance(summaries, list) and len(summaries) == len(texts)
+                        and all(isinstance(item, dict) for item in summaries)):
+                    return summaries
+        
+        return None
+
+    def _openai_analyze(self, prompt: str, max_tokens: int) -> Optional[str]:
+        """Send an analysis prompt to OpenAI and return the response text."""
         with httpx.Client(timeout=120.0) as client:
             response = client.post(
                 "https://api.openai.com/v1/chat/completions",
@@ -230,18 +306,12 @@ Transcript:
                         {"role": "user", "content": prompt}
                     ],
                     "temperature": 0.2,
-                    "max_tokens": 1000
+                    "max_tokens": max_tokens
                 }
             )
         
         if response.status_code == 200:
-            content = response.json()["choices"][0]["message"]["content"].strip()
-            # Extract JSON from response (in case there's extra text)
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = content[json_start:json_end]
-                return json.loads(json_str)
+            return response.json()["choices"][0]["message"]["content"].strip()
         
         return None
 
@@ -1,27 +1,37 @@
 """Command-line interface for P³."""
 
+import asyncio
+import copy
 import os
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 import click
 import yaml
 from rich.console import Console
 from rich.table import Table
-from rich.progress import track
+from rich.progress import Progress
 
 from .database import P3Database
-from .downloader import PodcastDownloader
-from .transcriber import AudioTranscriber
-from .cleaner import TranscriptCleaner
-from .exporter import DigestExporter
-from .writer import BlogWriter
 
-console = Console()
+# Prefer the LibYAML C parser; fall back to pure Python when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Rich already drops colors when piped; also skip its per-print highlight regexes
+console = Console(highlight=sys.stdout.isatty())
+
+# Parsed configs keyed by absolute path, validated against (mtime, size)
+_CONFIG_CACHE: "OrderedDict[str, tuple[float, int, dict]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 16
 
 
 def load_config(config_path: str = "config/feeds.yaml"):
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file, reusing the cached parse if unchanged."""
     config_file = Path(config_path)
     
     if not config_file.exists():
@@ -30,8 +40,20 @@ def load_config(config_path: str = "config/feeds.yaml"):
         sys.exit(1)
     
     try:
+        key = str(config_file.resolve())
+        st = config_file.stat()
+        entry = _CONFIG_CACHE.get(key)
+        if entry and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            _CONFIG_CACHE.move_to_end(key)
+            return copy.deepcopy(entry[2])
+        
         with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
+        
+        _CONFIG_CACHE[key] = (st.st_mtime, st.st_size, config)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+        return copy.deepcopy(config)
     except Exception as e:
         console.print(f"[red]Error loading config: {e}[/red]")
         sys.exit(1)
@@ -46,7 +68,14 @@ def main(ctx, config, db):
     ctx.ensure_object(dict)
     ctx.obj['config_path'] = config
     ctx.obj['db_path'] = db
-    ctx.obj['db'] = P3Database(db)
+    
+    def get_db(read_only=False):
+        """Open the database on first use; query-only commands open it read-only."""
+        if 'db' not in ctx.obj:
+            ctx.obj['db'] = P3Database(db, read_only=read_only)
+        return ctx.obj['db']
+    
+    ctx.obj['get_db'] = get_db
 
 
 @main.command()
@@ -54,8 +83,10 @@ def main(ctx, config, db):
 @click.pass_context
 def fetch(ctx, max_episodes):
     """Download new podcast episodes from configured RSS feeds."""
+    from .downloader import PodcastDownloader
+    
     config = load_config(ctx.obj['config_path'])
-    db = ctx.obj['db']
+    db = ctx.obj['get_db']()
     
     settings = config.get('settings', {})
     max_eps = max_episodes or settings.get('max_episodes_per_feed', 10)
@@ -92,11 +123,14 @@ def fetch(ctx, max_episodes):
 @main.command()
 @click.option('--model', default=None, help='Whisper model to use')
 @click.option('--episode-id', type=int, help='Transcribe specific episode')
+@click.option('--workers', default=1, type=click.IntRange(min=1), help='Parallel Whisper worker processes')
 @click.pass_context
-def transcribe(ctx, model, episode_id):
+def transcribe(ctx, model, episode_id, workers):
     """Transcribe downloaded audio files."""
+    from .transcriber import AudioTranscriber
+    
     config = load_config(ctx.obj['config_path'])
-    db = ctx.obj['db']
+    db = ctx.obj['get_db']()
     
     settings = config.get('settings', {})
     whisper_model = model or settings.get('whisper_model', 'base')
@@ -106,7 +140,8 @@ def transcribe(ctx, model, episode_id):
         db=db,
         whisper_model=whisper_model,
         use_parakeet=use_parakeet,
-        parakeet_model=settings.get('parakeet_model', 'mlx-community/parakeet-tdt-0.6b-v2')
+        parakeet_model=settings.get('parakeet_model', 'mlx-community/parakeet-tdt-0.6b-v2'),
+        workers=workers
     )
     
     if episode_id:
@@ -125,22 +160,60 @@ def transcribe(ctx, model, episode_id):
             return
         
         transcribed = 0
-        for episode in track(episodes, description="Transcribing..."):
-            if transcriber.transcribe_episode(episode['id']):
-                transcribed += 1
+        with Progress(console=console, refresh_per_second=4) as progress:
+            task = progress.add_task("Transcribing...", total=len(episodes))
+            for _, success in transcriber.transcribe_episodes(episodes):
+                if success:
+                    transcribed += 1
+                progress.advance(task)
         
         console.print(f"[green]Transcribed {transcribed} episodes[/green]")
 
 
+def _summarize_concurrently(cleaner, episodes, concurrency, batch_size=1):
+    """Generate summaries with at most `concurrency` LLM requests in flight.
+    
+    Episodes are sent `batch_size` at a time through generate_summary_batch.
+    Returns one result per episode: the summary dict, None, or the raised exception.
+    """
+    batches = [episodes[i:i + batch_size] for i in range(0, len(episodes), batch_size)]
+    
+    async def _run():
+        sem = asyncio.Semaphore(concurrency)
+        
+        with Progress(console=console, refresh_per_second=4) as progress:
+            task = progress.add_task("Processing...", total=len(episodes))
+            
+            async def _process(batch):
+                async with sem:
+                    try:
+                        return await asyncio.to_thread(
+                            cleaner.generate_summary_batch, [episode['id'] for episode in batch]
+                        )
+                    except Exception as e:
+                        return [e] * len(batch)
+                    finally:
+                        progress.advance(task, len(batch))
+            
+            batch_results = await asyncio.gather(*(_process(batch) for batch in batches))
+            return [result for results in batch_results for result in results]
+    
+    return asyncio.run(_run())
+
+
 @main.command()
 @click.option('--provider', default=None, help='LLM provider (openai, anthropic, ollama)')
 @click.option('--model', default=None, help='LLM model to use')
 @click.option('--episode-id', type=int, help='Process specific episode')
+@click.option('--concurrency', default=5, type=click.IntRange(min=1), help='Max LLM requests in parallel')
+@click.option('--batch-size', default=1, type=click.IntRange(min=1), help='Episodes per LLM request (OpenAI only)')
 @click.pass_context
-def digest(ctx, provider, model, episode_id):
+def digest(ctx, provider, model, episode_id, concurrency, batch_size):
     """Generate structured summaries from transcripts."""
+    from .cleaner import TranscriptCleaner
+    
     config = load_config(ctx.obj['config_path'])
-    db = ctx.obj['db']
+    db = ctx.obj['get_db']()
     
     settings = config.get('settings', {})
     llm_provider = provider or settings.get('llm_provider', 'openai')
@@ -162,10 +235,47 @@ def digest(ctx, provider, model, episode_id):
             console.print(f"[red]✗ Failed to process episode {episode_id}[/red]")
     else:
         console.print("[blue]Processing all transcribed episodes...[/blue]")
-        processed = cleaner.process_all_transcribed()
+        episodes = db.get_episodes_by_status('transcribed')
+        
+        if not episodes:
+            console.print("[yellow]No episodes to process[/yellow]")
+            return
+        
+        results = _summarize_concurrently(cleaner, episodes, concurrency, batch_size)
+        
+        processed = 0
+        failures: list[str] = []
+        for episode, result in zip(episodes, results):
+            if isinstance(result, Exception):
+                failures.append(f"[red]✗ Failed to process {episode['title']}: {result}[/red]")
+            elif result:
+                processed += 1
+            else:
+                failures.append(f"[red]✗ Failed to process {episode['title']}[/red]")
+        
+        if failures:
+            console.print("\n".join(failures))
+        
         console.print(f"[green]Processed {processed} episodes[/green]")
 
 
+EXPORT_EXTENSIONS = {'markdown': 'md', 'json': 'json'}
+
+
+def _render_export(exporter, fmt, summaries, digest_date, filename):
+    """Stream one export format to disk and return the file written."""
+    if fmt == 'markdown':
+        chunks = exporter.iter_markdown(summaries, digest_date)
+    else:
+        chunks = exporter.iter_json(summaries, digest_date)
+    
+    # Stream to file as sections are rendered
+    with open(filename, 'w') as f:
+        f.writelines(chunks)
+    
+    return filename
+
+
 @main.command()
 @click.option('--date', help='Export date (YYYY-MM-DD)')
 @click.option('--format', multiple=True, help='Export format (markdown, json)')
@@ -173,18 +283,22 @@ def digest(ctx, provider, model, episode_id):
 @click.pass_context
 def export(ctx, date, format, output):
     """Export daily digest summaries."""
+    from .exporter import DigestExporter
+    
     config = load_config(ctx.obj['config_path'])
-    db = ctx.obj['db']
+    db = ctx.obj['get_db'](read_only=True)
     
     # Parse date
     if date:
         try:
-            target_date = datetime.strptime(date, '%Y-%m-%d')
+            target_date = datetime.fromisoformat(date)
         except ValueError:
             console.print("[red]Invalid date format. Use YYYY-MM-DD[/red]")
             return
     else:
         target_date = datetime.now()
+    date_only = target_date.date()
+    date_iso = date_only.isoformat()
     
     # Get export formats
     formats = list(format) if format else config.get('settings', {}).get('export_format', ['markdown'])
@@ -194,42 +308,45 @@ def export(ctx, date, format, output):
     summaries = db.get_summaries_by_date(target_date)
     
     if not summaries:
-        console.print(f"[yellow]No summaries found for {target_date.date()}[/yellow]")
+        console.print(f"[yellow]No summaries found for {date_only}[/yellow]")
         return
     
-    console.print(f"[blue]Exporting {len(summaries)} summaries for {target_date.date()}[/blue]")
+    console.print(f"[blue]Exporting {len(summaries)} summaries for {date_only}[/blue]")
     
+    supported = []
     for fmt in formats:
-        if fmt == 'markdown':
-            content = exporter.export_markdown(summaries, target_date.date())
-            filename = output or f"digest_{target_date.strftime('%Y-%m-%d')}.md"
-        elif fmt == 'json':
-            content = exporter.export_json(summaries, target_date.date())
-            filename = output or f"digest_{target_date.strftime('%Y-%m-%d')}.json"
+        if fmt in EXPORT_EXTENSIONS:
+            supported.append(fmt)
         else:
             console.print(f"[red]Unsupported format: {fmt}[/red]")
-            continue
-        
-        # Write to file
-        with open(filename, 'w') as f:
-            f.write(content)
-        
-        console.print(f"[green]✓ Exported {fmt}: {filename}[/green]")
+    
+    if not supported:
+        return
+    
+    # Formats render independently; a shared --output path must be written in order
+    max_workers = 1 if output else len(supported)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                _render_export, exporter, fmt, summaries, date_only,
+                output or f"digest_{date_iso}.{EXPORT_EXTENSIONS[fmt]}"
+            ): fmt
+            for fmt in supported
+        }
+        for future in as_completed(futures):
+            console.print(f"[green]✓ Exported {futures[future]}: {future.result()}[/green]")
 
 
 @main.command()
 @click.pass_context
 def status(ctx):
     """Show processing status of episodes."""
-    db = ctx.obj['db']
+    db = ctx.obj['get_db'](read_only=True)
     
     # Count episodes by status
     statuses = ['downloaded', 'transcribed', 'processed']
-    counts = {}
-    
-    for status in statuses:
-        episodes = db.get_episodes_by_status(status)
-        counts[status] = len(episodes)
+    status_counts = db.get_status_counts()
+    counts = {status: status_counts.get(status, 0) for status in statuses}
     
     table = Table(title="Episode Processing Status")
     table.add_column("Status", style="cyan")
@@ -251,8 +368,10 @@ def write(ctx, topic, date, target_grade):
     
     Inspired by Tomasz Tunguz's innovative iterative writing approach.
     """
+    from .writer import BlogWriter
+    
     config = load_config(ctx.obj['config_path'])
-    db = ctx.obj['db']
+    db = ctx.obj['get_db'](read_only=True)
     
     settings = config.get('settings', {})
     llm_provider = settings.get('llm_provider', 'ollama')
@@ -261,17 +380,17 @@ def write(ctx, topic, date, target_grade):
     # Parse date
     if date:
         try:
-            target_date = datetime.strptime(date, '%Y-%m-%d')
+            target_date = datetime.fromisoformat(date)
         except ValueError:
             console.print("[red]Invalid date format. Use YYYY-MM-DD[/red]")
             return
     else:
         target_date = datetime.now()
     
-    # Get summaries for the date
-    summaries = db.get_summaries_by_date(target_date)
+    # Only the first summary is used, so don't load the rest of the day
+    primary_summary = db.get_first_summary_by_date(target_date)
     
-    if not summaries:
+    if not primary_summary:
         console.print(f"[yellow]No summaries found for {target_date.date()}[/yellow]")
         console.print("Run 'p3 digest' first to generate summaries")
         return
@@ -284,12 +403,11 @@ def write(ctx, topic, date, target_grade):
     )
     
     console.print(f"[blue]Generating blog post: '{topic}'[/blue]")
-    console.print(f"Using {len(summaries)} podcast summaries from {target_date.date()}")
+    summary_count = db.count_summaries_by_date(target_date)
+    console.print(f"Using {summary_count} podcast summaries from {target_date.date()}")
     console.print(f"Target grade: {target_grade}/100 (inspired by Tomasz Tunguz)")
     
-    # Use the first summary as primary source (could be enhanced to combine multiple)
-    primary_summary = summaries[0]
-    
+    # The first summary is the primary source (could be enhanced to combine multiple)
     with console.status("[bold green]Writing and grading blog post..."):
         blog_result = writer.generate_blog_post_from_digest(topic, primary_summary)
     
@@ -307,13 +425,12 @@ def write(ctx, topic, date, target_grade):
     social_posts = writer.generate_social_posts(blog_result)
     
     # Display social posts
-    console.print("\n[cyan]📱 Twitter Posts:[/cyan]")
-    for i, post in enumerate(social_posts['twitter'], 1):
-        console.print(f"{i}. {post}")
+    lines = ["\n[cyan]📱 Twitter Posts:[/cyan]"]
+    lines.extend(f"{i}. {post}" for i, post in enumerate(social_posts['twitter'], 1))
     
-    console.print("\n[cyan]💼 LinkedIn Posts:[/cyan]")
-    for i, post in enumerate(social_posts['linkedin'], 1):
-        console.print(f"{i}. {post[:100]}...")
+    lines.append("\n[cyan]💼 LinkedIn Posts:[/cyan]")
+    lines.extend(f"{i}. {post[:100]}..." for i, post in enumerate(social_posts['linkedin'], 1))
+    console.print("\n".join(lines))
     
     # Show final blog post preview
     console.print(f"\n[cyan]📄 Blog Post Preview:[/cyan]")
@@ -330,11 +447,13 @@ def init(ctx):
     """Initialize P³ configuration and directories."""
     console.print("[blue]Initializing P³...[/blue]")
     
-    # Create directories
-    dirs = ['data', 'config', 'logs', 'data/audio', 'exports', 'blog_posts']
+    # Create directories (data/audio also creates data)
+    dirs = ['config', 'logs', 'data/audio', 'exports', 'blog_posts']
+    lines: list[str] = []
     for dir_name in dirs:
-        Path(dir_name).mkdir(parents=True, exist_ok=True)
-        console.print(f"✓ Created directory: {dir_name}")
+        os.makedirs(dir_name, exist_ok=True)
+        lines.append(f"✓ Created directory: {dir_name}")
+    console.print("\n".join(lines))
     
     # Copy example config if it doesn't exist
     config_path = Path("config/feeds.yaml")
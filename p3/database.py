@@ -1,21 +1,79 @@
 """Database layer using DuckDB for P³ storage."""
 
+import json
 import os
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import duckdb
 from pathlib import Path
 
+SCHEMA_TABLES = ('podcasts', 'episodes', 'transcripts', 'summaries')
+
+# Explicit column list so row positions don't shift if the episodes table grows
+EPISODE_SELECT = """
+    SELECT e.id, e.podcast_id, e.title, e.date, e.url, e.file_path,
+           e.duration_seconds, e.status, e.created_at, p.title as podcast_title
+    FROM episodes e
+    JOIN podcasts p ON e.podcast_id = p.id
+"""
+
+SUMMARY_SELECT = """
+    SELECT s.*, e.title as episode_title, p.title as podcast_title
+    FROM summaries s
+    JOIN episodes e ON s.episode_id = e.id
+    JOIN podcasts p ON e.podcast_id = p.id
+"""
+
 
 class P3Database:
-    def __init__(self, db_path: str = "data/p3.duckdb"):
+    def __init__(self, db_path: str = "data/p3.duckdb", read_only: bool = False):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = duckdb.connect(str(self.db_path))
-        self._initialize_schema()
+        # A database that doesn't exist yet has to be created read-write
+        self.read_only = read_only and self.db_path.exists()
+        if not self.read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = duckdb.connect(str(self.db_path), read_only=self.read_only)
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+        if not self.read_only:
+            self._initialize_schema()
+
+    @property
+    def conn(self):
+        """Connection for the calling thread.
+
+        DuckDB connections are not thread-safe, so worker threads get their
+        own cursor on the same database.
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self._conn
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self._conn.cursor()
+        return cursor
 
     def _initialize_schema(self):
         """Create database schema if not exists."""
+        # One catalog lookup lets an already-initialized database skip the DDL
+        existing = {
+            row[0] for row in self.conn.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'"
+            ).fetchall()
+        }
+        if existing.issuperset(SCHEMA_TABLES):
+            return
+        
+        self.conn.begin()
+        try:
+            self._create_schema()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def _create_schema(self):
+        """Create sequences and tables."""
         self.conn.execute("""
             CREATE SEQUENCE IF NOT EXISTS podcast_id_seq START 1
         """)
@@ -123,29 +181,50 @@ class P3Database:
 
     def get_episodes_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get episodes by processing status."""
-        results = self.conn.execute("""
-            SELECT e.*, p.title as podcast_title 
-            FROM episodes e 
-            JOIN podcasts p ON e.podcast_id = p.id 
+        results = self.conn.execute(EPISODE_SELECT + """
             WHERE e.status = ?
             ORDER BY e.date DESC
         """, (status,)).fetchall()
         
-        episodes = []
-        for row in results:
-            episodes.append({
-                "id": row[0],
-                "podcast_id": row[1],
-                "title": row[2],
-                "date": row[3],
-                "url": row[4],
-                "file_path": row[5],
-                "duration_seconds": row[6],
-                "status": row[7],
-                "created_at": row[8],
-                "podcast_title": row[9]
-            })
-        return episodes
+        return [self._episode_from_row(row) for row in results]
+
+    def get_episode_by_id(self, episode_id: int, status: str = None) -> Optional[Dict[str, Any]]:
+        """Get a single episode, optionally only if it has the given status."""
+        query = EPISODE_SELECT + """
+            WHERE e.id = ?
+        """
+        params = [episode_id]
+        if status is not None:
+            query += " AND e.status = ?"
+            params.append(status)
+        
+        result = self.conn.execute(query, params).fetchone()
+        if result:
+            return self._episode_from_row(result)
+        return None
+
+    @staticmethod
+    def _episode_from_row(row) -> Dict[str, Any]:
+        """Map an EPISODE_SELECT row to a dict."""
+        return {
+            "id": row[0],
+            "podcast_id": row[1],
+            "title": row[2],
+            "date": row[3],
+            "url": row[4],
+            "file_path": row[5],
+            "duration_seconds": row[6],
+            "status": row[7],
+            "created_at": row[8],
+            "podcast_title": row[9]
+        }
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Count episodes per processing status."""
+        results = self.conn.execute(
+            "SELECT status, COUNT(*) FROM episodes GROUP BY status"
+        ).fetchall()
+        return {status: count for status, count in results}
 
     def update_episode_status(self, episode_id: int, status: str):
         """Update episode processing status."""
@@ -155,19 +234,23 @@ class P3Database:
         )
 
     def add_transcript_segments(self, episode_id: int, segments: List[Dict[str, Any]]):
-        """Add transcript segments for an episode."""
-        for segment in segments:
-            self.conn.execute("""
-                INSERT INTO transcripts (episode_id, speaker, timestamp_start, timestamp_end, text, confidence) 
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                episode_id,
-                segment.get("speaker"),
-                segment.get("start"),
-                segment.get("end"),
-                segment.get("text"),
-                segment.get("confidence")
-            ))
+        """Add transcript segments for an episode with a single INSERT."""
+        if not segments:
+            return
+        
+        # Pass one list per column and let DuckDB unnest them into rows
+        self.conn.execute("""
+            INSERT INTO transcripts (episode_id, speaker, timestamp_start, timestamp_end, text, confidence)
+            SELECT ?, unnest(?::VARCHAR[]), unnest(?::REAL[]), unnest(?::REAL[]),
+                   unnest(?::VARCHAR[]), unnest(?::REAL[])
+        """, (
+            episode_id,
+            [segment.get("speaker") for segment in segments],
+            [segment.get("start") for segment in segments],
+            [segment.get("end") for segment in segments],
+            [segment.get("text") for segment in segments],
+            [segment.get("confidence") for segment in segments]
+        ))
 
     def get_transcripts_for_episode(self, episode_id: int) -> List[Dict[str, Any]]:
         """Get all transcript segments for an episode."""
@@ -190,14 +273,21 @@ class P3Database:
             })
         return transcripts
 
+    def get_transcript_text(self, episode_id: int) -> str:
+        """Get an episode's transcript as newline-joined segment text."""
+        result = self.conn.execute("""
+            SELECT COALESCE(string_agg(text, '\n' ORDER BY timestamp_start), '')
+            FROM transcripts WHERE episode_id = ?
+        """, (episode_id,)).fetchone()
+        return result[0]
+
     def add_summary(self, episode_id: int, key_topics: List[str], themes: List[str],
                    quotes: List[str], startups: List[str], full_summary: str,
                    digest_date: datetime = None):
         """Add episode summary."""
         if digest_date is None:
             digest_date = datetime.now().date()
-            
-        import json
+
         self.conn.execute("""
             INSERT INTO summaries (episode_id, key_topics, themes, quotes, startups, full_summary, digest_date) 
             VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -213,34 +303,49 @@ class P3Database:
 
     def get_summaries_by_date(self, date: datetime) -> List[Dict[str, Any]]:
         """Get all summaries for a specific date."""
-        results = self.conn.execute("""
-            SELECT s.*, e.title as episode_title, p.title as podcast_title
-            FROM summaries s
-            JOIN episodes e ON s.episode_id = e.id
-            JOIN podcasts p ON e.podcast_id = p.id
+        results = self.conn.execute(SUMMARY_SELECT + """
             WHERE s.digest_date = ?
             ORDER BY p.title, e.title
         """, (date.date(),)).fetchall()
         
-        summaries = []
-        for row in results:
-            import json
-            summaries.append({
-                "id": row[0],
-                "episode_id": row[1],
-                "key_topics": json.loads(row[2]),
-                "themes": json.loads(row[3]),
-                "quotes": json.loads(row[4]),
-                "startups": json.loads(row[5]),
-                "digest_date": row[6],
-                "full_summary": row[7],
-                "created_at": row[8],
-                "episode_title": row[9],
-                "podcast_title": row[10]
-            })
-        return summaries
+        return [self._summary_from_row(row) for row in results]
+
+    def get_first_summary_by_date(self, date: datetime) -> Optional[Dict[str, Any]]:
+        """Get the first summary for a date in get_summaries_by_date order."""
+        result = self.conn.execute(SUMMARY_SELECT + """
+            WHERE s.digest_date = ?
+            ORDER BY p.title, e.title
+            LIMIT 1
+        """, (date.date(),)).fetchone()
+        
+        if result:
+            return self._summary_from_row(result)
+        return None
+
+    def count_summaries_by_date(self, date: datetime) -> int:
+        """Count summaries for a specific date."""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM summaries WHERE digest_date = ?", (date.date(),)
+        ).fetchone()[0]
+
+    @staticmethod
+    def _summary_from_row(row) -> Dict[str, Any]:
+        """Map a SUMMARY_SELECT row to a dict."""
+        return {
+            "id": row[0],
+            "episode_id": row[1],
+            "key_topics": json.loads(row[2]),
+            "themes": json.loads(row[3]),
+            "quotes": json.loads(row[4]),
+            "startups": json.loads(row[5]),
+            "digest_date": row[6],
+            "full_summary": row[7],
+            "created_at": row[8],
+            "episode_title": row[9],
+            "podcast_title": row[10]
+        }
 
     def close(self):
         """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        if self._conn:
+            self._conn.close()
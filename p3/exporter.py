@@ -2,7 +2,7 @@
 
 import json
 from datetime import date
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 
 
 class DigestExporter:
@@ -11,11 +11,15 @@ class DigestExporter:
 
     def export_markdown(self, summaries: List[Dict[str, Any]], target_date: date) -> str:
         """Export summaries as Markdown."""
-        content = [f"# Podcast Digest - {target_date}\n"]
+        return "".join(self.iter_markdown(summaries, target_date))
+
+    def iter_markdown(self, summaries: List[Dict[str, Any]], target_date: date) -> Iterator[str]:
+        """Yield the Markdown digest one podcast/episode section at a time."""
+        yield f"# Podcast Digest - {target_date}\n"
         
         if not summaries:
-            content.append("No summaries available for this date.\n")
-            return "\n".join(content)
+            yield "\nNo summaries available for this date.\n"
+            return
         
         # Group by podcast
         by_podcast = {}
@@ -25,11 +29,12 @@ class DigestExporter:
                 by_podcast[podcast] = []
             by_podcast[podcast].append(summary)
         
+        # Each chunk starts with the newline separating it from the previous one
         for podcast_name, episodes in by_podcast.items():
-            content.append(f"## {podcast_name}\n")
+            yield f"\n## {podcast_name}\n"
             
             for episode in episodes:
-                content.append(f"### {episode['episode_title']}\n")
+                content = [f"### {episode['episode_title']}\n"]
                 
                 if episode['full_summary']:
                     content.append(f"**Summary:** {episode['full_summary']}\n")
@@ -59,18 +64,21 @@ class DigestExporter:
                     content.append("")
                 
                 content.append("---\n")
-        
-        return "\n".join(content)
+                yield "\n" + "\n".join(content)
 
     def export_json(self, summaries: List[Dict[str, Any]], target_date: date) -> str:
         """Export summaries as JSON."""
+        return "".join(self.iter_json(summaries, target_date))
+
+    def iter_json(self, summaries: List[Dict[str, Any]], target_date: date) -> Iterator[str]:
+        """Yield the JSON digest in encoder-sized chunks."""
         export_data = {
             "date": str(target_date),
             "total_episodes": len(summaries),
             "summaries": summaries
         }
         
-        return json.dumps(export_data, indent=2, default=str)
+        return json.JSONEncoder(indent=2, default=str).iterencode(export_data)
 
     def export_email_html(self, summaries: List[Dict[str, Any]], target_date: date) -> str:
         """Export summaries as HTML for email."""
@@ -3,8 +3,9 @@
 import json
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import whisper
 
 from .database import P3Database
@@ -17,13 +18,62 @@ except ImportError:
     PARAKEET_AVAILABLE = False
 
 
+def _run_whisper(model, audio_path: str) -> Optional[Dict[str, Any]]:
+    """Transcribe audio with a loaded Whisper model and convert to our format."""
+    try:
+        result = model.transcribe(
+            audio_path,
+            word_timestamps=True,
+            verbose=False
+        )
+        
+        # Convert Whisper output to our format
+        segments = []
+        for segment in result.get('segments', []):
+            segments.append({
+                'start': segment.get('start', 0),
+                'end': segment.get('end', 0),
+                'text': segment.get('text', '').strip(),
+                'speaker': None,  # Whisper doesn't do speaker detection
+                'confidence': segment.get('no_speech_prob', 0.0)
+            })
+        
+        return {
+            'segments': segments,
+            'language': result.get('language'),
+            'text': result.get('text', ''),
+            'provider': 'whisper'
+        }
+        
+    except Exception as e:
+        print(f"Whisper transcription failed: {e}")
+        return None
+
+
+# Whisper model owned by a transcription worker process
+_worker_whisper = None
+
+
+def _init_whisper_worker(model_name: str):
+    """Load the Whisper model once per worker process."""
+    global _worker_whisper
+    _worker_whisper = whisper.load_model(model_name)
+
+
+def _whisper_worker_transcribe(audio_path: str) -> Optional[Dict[str, Any]]:
+    """Transcribe audio in a worker process with its preloaded model."""
+    return _run_whisper(_worker_whisper, audio_path)
+
+
 class AudioTranscriber:
     def __init__(self, db: P3Database, whisper_model: str = "base", 
-                 use_parakeet: bool = False, parakeet_model: str = "mlx-community/parakeet-tdt-0.6b-v2"):
+                 use_parakeet: bool = False, parakeet_model: str = "mlx-community/parakeet-tdt-0.6b-v2",
+                 workers: int = 1):
         self.db = db
         self.whisper_model = whisper_model
         self.use_parakeet = use_parakeet
         self.parakeet_model = parakeet_model
+        self.workers = max(1, workers)
         self.whisper = None
         self.parakeet = None
         
@@ -42,35 +92,7 @@ class AudioTranscriber:
     def transcribe_with_whisper(self, audio_path: str) -> Dict[str, Any]:
         """Transcribe audio using OpenAI Whisper."""
         self._load_whisper()
-        
-        try:
-            result = self.whisper.transcribe(
-                audio_path,
-                word_timestamps=True,
-                verbose=False
-            )
-            
-            # Convert Whisper output to our format
-            segments = []
-            for segment in result.get('segments', []):
-                segments.append({
-                    'start': segment.get('start', 0),
-                    'end': segment.get('end', 0),
-                    'text': segment.get('text', '').strip(),
-                    'speaker': None,  # Whisper doesn't do speaker detection
-                    'confidence': segment.get('no_speech_prob', 0.0)
-                })
-            
-            return {
-                'segments': segments,
-                'language': result.get('language'),
-                'text': result.get('text', ''),
-                'provider': 'whisper'
-            }
-            
-        except Exception as e:
-            print(f"Whisper transcription failed: {e}")
-            return None
+        return _run_whisper(self.whisper, audio_path)
 
     def transcribe_with_parakeet(self, audio_path: str) -> Optional[Dict[str, Any]]:
         """Transcribe audio using Nvidia Parakeet MLX."""
@@ -108,15 +130,13 @@ class AudioTranscriber:
 
     def transcribe_episode(self, episode_id: int) -> bool:
         """Transcribe a single episode and store results."""
-        episodes = self.db.get_episodes_by_status('downloaded')
-        episode = next((ep for ep in episodes if ep['id'] == episode_id), None)
+        episode = self.db.get_episode_by_id(episode_id, status='downloaded')
         
         if not episode:
             print(f"Episode {episode_id} not found or already processed")
             return False
 
-        if not episode['file_path'] or not Path(episode['file_path']).exists():
-            print(f"Audio file not found: {episode.get('file_path')}")
+        if not self._has_audio(episode):
             return False
 
         print(f"Transcribing: {episode['title']}")
@@ -127,42 +147,85 @@ class AudioTranscriber:
         else:
             result = self.transcribe_with_whisper(episode['file_path'])
         
+        return self._store_result(episode, result)
+
+    def _has_audio(self, episode: Dict[str, Any]) -> bool:
+        """Check that the episode's audio file is present on disk."""
+        if not episode['file_path'] or not Path(episode['file_path']).exists():
+            print(f"Audio file not found: {episode.get('file_path')}")
+            return False
+        return True
+
+    def _store_result(self, episode: Dict[str, Any], result: Optional[Dict[str, Any]]) -> bool:
+        """Store transcript segments and mark the episode transcribed."""
         if not result:
             return False
 
         # Store transcript segments in database
-        self.db.add_transcript_segments(episode_id, result['segments'])
+        self.db.add_transcript_segments(episode['id'], result['segments'])
         
         # Update episode status
-        self.db.update_episode_status(episode_id, 'transcribed')
+        self.db.update_episode_status(episode['id'], 'transcribed')
         
         print(f"✓ Transcribed: {episode['title']}")
         return True
 
+    def transcribe_episodes(self, episodes: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], bool]]:
+        """Transcribe episodes, yielding (episode, success) as each one finishes.
+        
+        With more than one worker, Whisper runs in a pool of processes that
+        each load their own model; results are written to the database from
+        this process. Parakeet always runs in-process.
+        """
+        if self.workers == 1 or self.use_parakeet:
+            for episode in episodes:
+                yield episode, self.transcribe_episode(episode['id'])
+            return
+
+        pending = []
+        for episode in episodes:
+            if self._has_audio(episode):
+                pending.append(episode)
+            else:
+                yield episode, False
+
+        if not pending:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(pending)),
+                                 initializer=_init_whisper_worker,
+                                 initargs=(self.whisper_model,)) as pool:
+            futures = {}
+            for episode in pending:
+                print(f"Transcribing: {episode['title']}")
+                futures[pool.submit(_whisper_worker_transcribe, episode['file_path'])] = episode
+
+            for future in as_completed(futures):
+                episode = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Whisper worker failed for {episode['title']}: {e}")
+                    result = None
+                yield episode, self._store_result(episode, result)
+
     def transcribe_all_pending(self) -> int:
         """Transcribe all episodes with 'downloaded' status."""
         episodes = self.db.get_episodes_by_status('downloaded')
-        transcribed_count = 0
-        
-        for episode in episodes:
-            if self.transcribe_episode(episode['id']):
-                transcribed_count += 1
-            
-        return transcribed_count
+        return sum(1 for _, success in self.transcribe_episodes(episodes) if success)
 
     def get_full_transcript(self, episode_id: int) -> str:
         """Get the full transcript text for an episode."""
-        segments = self.db.get_transcripts_for_episode(episode_id)
-        return "\n".join(segment['text'] for segment in segments)
+        return self.db.get_transcript_text(episode_id)
 
     def export_transcript(self, episode_id: int, format: str = "txt") -> str:
         """Export transcript in various formats."""
-        segments = self.db.get_transcripts_for_episode(episode_id)
-        
         if format == "txt":
-            return "\n".join(segment['text'] for segment in segments)
+            return self.db.get_transcript_text(episode_id)
+        
+        segments = self.db.get_transcripts_for_episode(episode_id)
         
-        elif format == "srt":
+        if format == "srt":
             srt_content = []
             for i, segment in enumerate(segments, 1):
                 start_time = self._seconds_to_srt_time(segment['timestamp_start'] or 0)